@@ -1,6 +1,27 @@
 """Top-level package for Netatmo GeoPy."""
-from .core import *
+from importlib import import_module
+
+# the settings and utils are cheap to import (they do not require geopandas)
+from . import settings, utils
 
 __author__ = """Martí Bosch"""
 __email__ = "marti.bosch@epfl.ch"
 __version__ = "0.1.0"
+
+# the public API lives in `core`, which is imported lazily (on first attribute access,
+# see PEP 562) since it requires geopandas (which is costly to import). This is the
+# single list of its public names, which `core` reuses as its own `__all__`
+__all__ = ["plot_snapshot", "plot_snapshot_update", "CWSRecorder", "CWSDataset"]
+_LAZY_SUBMODULES = ["auth", "core"]
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return import_module(f".{name}", __name__)
+    if name in __all__:
+        return getattr(import_module(".core", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_LAZY_SUBMODULES))
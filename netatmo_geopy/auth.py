@@ -1,12 +1,38 @@
 """Authentication."""
 
+import json
+import os
+import threading
+import time
+
 import requests_oauthlib
 from oauthlib import oauth2
+from requests import adapters
+from urllib3 import util
 
 from . import settings
 
 __all__ = ["NetatmoConnect"]
 
+# HTTP adapter (and thus connection pool) shared by all the sessions
+_http_adapter = None
+
+
+def _get_http_adapter():
+    global _http_adapter
+    if _http_adapter is None:
+        _http_adapter = adapters.HTTPAdapter(
+            pool_connections=settings.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+            # retry transient (connection) errors with an exponential backoff rather
+            # than losing the snapshot
+            max_retries=util.Retry(
+                total=settings.HTTP_MAX_RETRIES,
+                backoff_factor=settings.HTTP_BACKOFF_FACTOR,
+            ),
+        )
+    return _http_adapter
+
 
 class RefreshOAuth2Session(requests_oauthlib.OAuth2Session):
     """RefreshOAuth2Session."""
@@ -27,51 +53,113 @@ class NetatmoConnect(object):
     _session = None
     _token = None
 
-    def __init__(self, client_id, client_secret, username, password, *args, **kwargs):
+    def __init__(
+        self,
+        client_id,
+        client_secret,
+        username,
+        password,
+        *args,
+        token_cache_filepath=None,
+        **kwargs,
+    ):
         super(NetatmoConnect, self).__init__(*args, **kwargs)
         self.client_id = client_id
         self.client_secret = client_secret
         self.username = username
         self.password = password
         self.scope = "read_station"
+        if token_cache_filepath is None:
+            token_cache_filepath = settings.TOKEN_CACHE_FILEPATH
+        self.token_cache_filepath = token_cache_filepath
+        # avoids fetching several tokens when the session is first accessed from
+        # multiple threads
+        self._session_lock = threading.Lock()
+
+    def _load_cached_token(self):
+        try:
+            with open(self.token_cache_filepath) as src:
+                token_cache_dict = json.load(src)
+        except (OSError, ValueError):
+            return None
+        # only reuse non-expired tokens for the same client and user
+        if token_cache_dict.get("client_id") != self.client_id or (
+            token_cache_dict.get("username") != self.username
+        ):
+            return None
+        token = token_cache_dict.get("token")
+        if token is None or token.get("expires_at", float("inf")) <= time.time():
+            return None
+        return token
+
+    def _dump_cached_token(self, token):
+        # the file is only readable/writable by its owner since it contains the token
+        fd = os.open(
+            self.token_cache_filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        # the mode above only applies when the file is created, so also restrict the
+        # permissions of an existing file before writing the token into it (not
+        # available on Windows, where POSIX permissions do not apply anyway)
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w") as dst:
+            json.dump(
+                {
+                    "client_id": self.client_id,
+                    "username": self.username,
+                    "token": token,
+                },
+                dst,
+            )
 
     def token_updater(self, token):
         """Token updater."""
         self._token = token
+        if self.token_cache_filepath is not None:
+            self._dump_cached_token(token)
 
     @property
     def session(self):
         """Session."""
-        if self._session is None:
-            self._session = RefreshOAuth2Session(
+        if self._session is not None:
+            return self._session
+
+        with self._session_lock:
+            if self._session is not None:  # pragma: no cover
+                return self._session
+            # reuse the token persisted by a previous run (if any)
+            if self._token is None and self.token_cache_filepath is not None:
+                self._token = self._load_cached_token()
+            auto_refresh_kwargs = {
+                "token_url": settings.OAUTH2_TOKEN_URL,
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "username": self.username,
+                "password": self.password,
+            }
+            # build (and authenticate) the session in a local variable so that other
+            # callers (e.g., recorders sharing this connection from executor threads)
+            # never get a session whose token has not been fetched yet
+            session = RefreshOAuth2Session(
                 client=oauth2.LegacyApplicationClient(
                     client_id=self.client_id, scope=self.scope
                 ),
-                token=self.token,
+                token=self._token,
                 token_updater=self.token_updater,
-                auto_refresh_kwargs={
-                    "token_url": settings.OAUTH2_TOKEN_URL,
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "username": self.username,
-                    "password": self.password,
-                },
+                auto_refresh_kwargs=auto_refresh_kwargs,
             )
+            # reuse the underlying connections (and thus avoid TCP/TLS handshakes)
+            # across requests, including those of other sessions (e.g., recorders with
+            # different credentials)
+            session.mount("https://", _get_http_adapter())
+            # fetch the token with the same session (rather than instantiating another
+            # one just to that end)
+            if self._token is None:
+                self.token_updater(session.fetch_token(**auto_refresh_kwargs))
+            self._session = session
         return self._session
 
     @property
     def token(self):
         """Token."""
-        if self._token is None:
-            self._token = RefreshOAuth2Session(
-                client=oauth2.LegacyApplicationClient(
-                    client_id=self.client_id, scope=self.scope
-                )
-            ).fetch_token(
-                token_url=settings.OAUTH2_TOKEN_URL,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-                username=self.username,
-                password=self.password,
-            )
-        return self._token
+        return self.session.token
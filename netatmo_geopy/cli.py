@@ -1,6 +1,5 @@
 """Console script for netatmo_geopy."""
-
-import fire
+import sys
 
 
 def help():
@@ -12,6 +11,13 @@ def help():
 
 def main():
     """Main."""
+    # the help banner does not need fire, so avoid its (costly) import altogether
+    if sys.argv[1:] == ["help"]:
+        help()
+        return
+
+    import fire
+
     fire.Fire({"help": help})
 
 
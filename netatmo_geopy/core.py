@@ -1,42 +1,73 @@
 """Main module."""
+import asyncio
 import glob
+import importlib.util
 import json
 import pathlib as pl
-import re
 import time
+from concurrent import futures
 from datetime import datetime
-from functools import reduce
+from functools import lru_cache, partial
 from os import environ, path
+from urllib import parse
 
-import contextily as cx
 import geopandas as gpd
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import schedule
-import tqdm
-from fiona import errors as fiona_errors
-from mpl_toolkits.axes_grid1 import make_axes_locatable
-from scipy.stats import norm
-from shapely import geometry
-from statsmodels.robust import scale
 
-from . import auth, settings, utils
+# the public names (`__all__`) are listed once, in the package's `__init__`
+from . import __all__, auth, settings, utils
 
-__all__ = ["plot_snapshot", "CWSRecorder", "CWSDataset"]
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import pyogrio
+except ImportError:  # pragma: no cover
+    pyogrio = None
+
+# whether pyogrio can read through (the much faster) Arrow interface, which requires
+# pyarrow (checked without actually importing it, which is costly) and GDAL>=3.6
+_PYOGRIO_USE_ARROW = (
+    pyogrio is not None
+    and importlib.util.find_spec("pyarrow") is not None
+    and pyogrio.__gdal_version__ >= (3, 6, 0)
+)
+# writing through the Arrow interface requires pyogrio>=0.8 and GDAL>=3.8
+_PYOGRIO_WRITE_USE_ARROW = (
+    _PYOGRIO_USE_ARROW
+    and tuple(int(part) for part in pyogrio.__version__.split(".")[:2]) >= (0, 8)
+    and pyogrio.__gdal_version__ >= (3, 8, 0)
+)
 
 NETATMO_CRS = "epsg:4326"
+# single precision is more than enough for temperatures (measured at 0.1 degrees) and
+# halves the memory footprint of the time series
+TEMPERATURE_DTYPE = "float32"
+# native CRS of the (web) basemap tiles
+WEB_MERCATOR_CRS = "epsg:3857"
+# domain of the public data API (only used for logging), computed once at import time
+_PUBLIC_DATA_DOMAIN = parse.urlsplit(settings.PUBLIC_DATA_URL).netloc
 
 
-def _get_public_data(
-    lon_sw,
-    lat_sw,
-    lon_ne,
-    lat_ne,
-    *,
-    client_id=None,
-    client_secret=None,
-    username=None,
-    password=None,
+def _json_loads(content):
+    # use orjson (if available) since it is significantly faster than the stdlib json
+    if orjson is None:  # pragma: no cover
+        return json.loads(content)
+    return orjson.loads(content)
+
+
+@lru_cache(maxsize=None)
+def _cached_netatmo_connect(client_id, client_secret, username, password):
+    # cache the connections so that the underlying session (i.e., connection pool and
+    # token) is reused across API calls with the same credentials
+    return auth.NetatmoConnect(client_id, client_secret, username, password)
+
+
+def _get_netatmo_connect(
+    *, client_id=None, client_secret=None, username=None, password=None
 ):
     if client_id is None:
         client_id = environ.get("NETATMO_CLIENT_ID")
@@ -46,7 +77,10 @@ def _get_public_data(
         username = environ.get("NETATMO_USERNAME")
     if password is None:
         password = environ.get("NETATMO_PASSWORD")
-    conn = auth.NetatmoConnect(client_id, client_secret, username, password)
+    return _cached_netatmo_connect(client_id, client_secret, username, password)
+
+
+def _get_public_data(conn, lon_sw, lat_sw, lon_ne, lat_ne):
     public_data_dict = dict(
         lon_sw=lon_sw,
         lat_sw=lat_sw,
@@ -55,65 +89,263 @@ def _get_public_data(
         required_data="temperature",
     )
 
-    response = conn.session.get(settings.PUBLIC_DATA_URL, data=public_data_dict)
-    size_kb = len(response.content) / 1000
-    domain = re.findall(r"(?s)//(.*?)/", settings.PUBLIC_DATA_URL)[0]
-    utils.log(f"Downloaded {size_kb:,.2f}kB from {domain}")
-    return response.json()
+    # this is a GET request, so send the parameters in the query string
+    response = conn.session.get(settings.PUBLIC_DATA_URL, params=public_data_dict)
+    # return the raw response body so that it can be parsed straight from bytes and
+    # stored verbatim (without serializing it again)
+    content = response.content
+    if utils.log_enabled():
+        # log the on-the-wire size, i.e., possibly compressed (see the Content-Encoding
+        # header), falling back to the length of the decoded body when the header is
+        # missing (e.g., for chunked responses)
+        size_kb = int(response.headers.get("content-length", len(content))) / 1000
+        utils.log(f"Downloaded {size_kb:,.2f}kB from {_PUBLIC_DATA_DOMAIN}")
+    return content
 
 
 def _gdf_from_response_json(response_json, datetime_format):
-    def _get_id_temperature_geom(station_record):
+    # cache the position of the temperature within each (distinct) tuple of measure
+    # types, since there are only a few of them
+    temperature_index_dict = {}
+
+    def _get_id_temperature_lon_lat(station_record):
         for measure_key, measure_value_dict in station_record["measures"].items():
-            try:
+            measure_types = tuple(measure_value_dict["type"])
+            # a single lookup for the (common) case of already-seen measure types
+            temperature_index = temperature_index_dict.get(measure_types, -1)
+            if temperature_index == -1:
+                # use a membership check rather than exceptions as control flow
+                temperature_index = temperature_index_dict[measure_types] = (
+                    measure_types.index("temperature")
+                    if "temperature" in measure_types
+                    else None
+                )
+            if temperature_index is not None:
+                lon, lat = station_record["place"]["location"]
                 return (
                     measure_key,
-                    next(iter(measure_value_dict["res"].values()))[
-                        measure_value_dict["type"].index("temperature")
-                    ],
-                    geometry.Point(*station_record["place"]["location"]),
+                    next(iter(measure_value_dict["res"].values()))[temperature_index],
+                    lon,
+                    lat,
                 )
-            except ValueError:
-                pass
 
         return None
 
+    # collect plain sequences first and then build all the point geometries at once
+    station_records = [
+        station_record
+        for station_record in map(_get_id_temperature_lon_lat, response_json["body"])
+        if station_record is not None
+    ]
+    if station_records:
+        station_ids, temperatures, lons, lats = zip(*station_records)
+    else:  # pragma: no cover
+        station_ids, temperatures, lons, lats = [], [], [], []
+
     return gpd.GeoDataFrame(
-        [
-            _get_id_temperature_geom(station_record)
-            for station_record in response_json["body"]
-        ],
-        columns=[
-            "station_id",
+        {
+            "station_id": station_ids,
             datetime.fromtimestamp(response_json["time_server"]).strftime(
                 datetime_format
-            ),
-            "geometry",
-        ],
+            ): temperatures,
+        },
+        geometry=gpd.points_from_xy(lons, lats),
         crs=NETATMO_CRS,
     ).set_index("station_id")
 
 
+def _read_snapshot_gdf(snapshot_filepath, *, read_geometry=True):
+    # GeoParquet files keep the "station_id" index, OGR vector files do not
+    if str(snapshot_filepath).endswith(".parquet"):
+        if read_geometry:
+            return gpd.read_parquet(snapshot_filepath)
+        # avoid decoding the WKB geometries altogether
+        return pd.read_parquet(snapshot_filepath).drop(columns="geometry")
+    # use pyogrio (if available) since it reads the whole layer in a single batched
+    # call (rather than iterating over features as in fiona)
+    if pyogrio is None:  # pragma: no cover
+        snapshot_df = gpd.read_file(
+            snapshot_filepath, ignore_geometry=not read_geometry
+        )
+    else:
+        snapshot_df = pyogrio.read_dataframe(
+            snapshot_filepath,
+            read_geometry=read_geometry,
+            use_arrow=_PYOGRIO_USE_ARROW,
+        )
+    return snapshot_df.set_index("station_id")
+
+
+def _write_snapshot_gdf(snapshot_gdf, dst_filepath):
+    dst_filepath = str(dst_filepath)
+    if dst_filepath.endswith(".parquet"):
+        snapshot_gdf.to_parquet(dst_filepath, compression="zstd")
+        return
+    # the FlatGeobuf driver cannot be inferred from the extension by all engines
+    if dst_filepath.endswith(".fgb"):
+        driver = "FlatGeobuf"
+    else:
+        driver = None
+    if pyogrio is None:  # pragma: no cover
+        snapshot_gdf.to_file(dst_filepath, driver=driver)
+    else:
+        # pyogrio does not write the index
+        write_kws = {"use_arrow": True} if _PYOGRIO_WRITE_USE_ARROW else {}
+        pyogrio.write_dataframe(
+            snapshot_gdf.reset_index(), dst_filepath, driver=driver, **write_kws
+        )
+
+
+def _get_coords_df(snapshot_gdf):
+    return pd.DataFrame(
+        {"x": snapshot_gdf.geometry.x, "y": snapshot_gdf.geometry.y},
+        index=snapshot_gdf.index,
+    )
+
+
 def _join_snapshot_gdfs(snapshot_filepaths):
-    temperature_gdf = reduce(
-        lambda left, right: pd.merge(
-            left, right, on=["station_id", "geometry"], how="outer"
-        ),
+    import tqdm
+
+    # snapshot files are named after their timestamp (see `dump_snapshot_gdf`), which
+    # is formatted so that the lexical and chronological orders match, hence sorting
+    # the files beforehand already yields chronologically-sorted columns
+    snapshot_filepaths = sorted(
+        snapshot_filepaths,
+        key=lambda snapshot_filepath: path.basename(str(snapshot_filepath)),
+    )
+    # since station locations do not change, only the first snapshot is read with its
+    # geometries, the remaining ones are read as plain (attribute-only) data frames
+    snapshot_gdf = _read_snapshot_gdf(snapshot_filepaths[0])
+    # a single snapshot is already a time series geo-data frame (with the stations
+    # sorted by id, as when joining several snapshots)
+    if len(snapshot_filepaths) == 1:
+        if not snapshot_gdf.index.is_monotonic_increasing:
+            snapshot_gdf = snapshot_gdf.sort_index()
+        return snapshot_gdf.astype({_get_basename(snapshot_gdf): TEMPERATURE_DTYPE})
+    # since the geometries are points, store them once per station as plain coordinate
+    # arrays rather than keeping a geometry array for each snapshot
+    coords_dfs = [_get_coords_df(snapshot_gdf)]
+    snapshot_dfs = [snapshot_gdf.drop(columns="geometry")]
+    # the reads are I/O-bound (and GDAL releases the GIL), so they can be overlapped
+    # using threads
+    with futures.ThreadPoolExecutor(
+        max_workers=min(settings.READ_MAX_WORKERS, len(snapshot_filepaths) - 1)
+    ) as executor:
+        snapshot_dfs += tqdm.tqdm(
+            executor.map(
+                partial(_read_snapshot_gdf, read_geometry=False),
+                snapshot_filepaths[1:],
+            ),
+            total=len(snapshot_filepaths) - 1,
+        )
+    # only read the geometries again for snapshots with stations not seen before
+    station_ids = coords_dfs[0].index
+    for snapshot_filepath, snapshot_df in zip(snapshot_filepaths[1:], snapshot_dfs[1:]):
+        new_station_ids = snapshot_df.index.difference(station_ids)
+        if not new_station_ids.empty:
+            coords_dfs.append(
+                _get_coords_df(_read_snapshot_gdf(snapshot_filepath)).loc[
+                    new_station_ids
+                ]
+            )
+            station_ids = station_ids.union(new_station_ids)
+    coords_df = pd.concat(coords_dfs)
+
+    # fill a preallocated (station x snapshot) matrix, with the stations from the union
+    # of all the snapshot indices built above (rather than successively merging the
+    # snapshots), sorted by id
+    if not station_ids.is_monotonic_increasing:
+        station_ids = station_ids.sort_values()
+    station_ids = station_ids.rename("station_id")
+    ts_arr = np.full(
+        (len(station_ids), len(snapshot_dfs)), np.nan, dtype=TEMPERATURE_DTYPE
+    )
+    for j, snapshot_df in enumerate(snapshot_dfs):
+        ts_arr[station_ids.get_indexer(snapshot_df.index), j] = snapshot_df[
+            snapshot_df.columns[0]
+        ].to_numpy()
+    ts_df = pd.DataFrame(
+        ts_arr,
+        index=station_ids,
+        columns=[snapshot_df.columns[0] for snapshot_df in snapshot_dfs],
+    )
+    # only reorder (i.e., copy) the columns if the files were not named after their
+    # timestamp
+    if not ts_df.columns.is_monotonic_increasing:  # pragma: no cover
+        ts_df = ts_df.reindex(columns=sorted(ts_df.columns))
+    # build a single geometry array (attached as the last column) from the station
+    # coordinates
+    coords_df = coords_df.reindex(ts_df.index)
+    return gpd.GeoDataFrame(
+        ts_df,
+        geometry=gpd.points_from_xy(coords_df["x"], coords_df["y"]),
+        crs=NETATMO_CRS,
+    )
+
+
+def _concat_ts_gdfs(ts_gdf, other_ts_gdf):
+    # align both time series on the union of their stations, taking the coordinates of
+    # the stations in `other_ts_gdf` only for the ones not in `ts_gdf`
+    station_ids = ts_gdf.index.union(other_ts_gdf.index)
+    ts_df = pd.concat(
         [
-            gpd.read_file(snapshot_filepath)
-            for snapshot_filepath in tqdm.tqdm(snapshot_filepaths)
+            ts_gdf.drop(columns="geometry").reindex(station_ids),
+            other_ts_gdf.drop(columns="geometry").reindex(station_ids),
         ],
+        axis=1,
+    )
+    if not ts_df.columns.is_monotonic_increasing:
+        ts_df = ts_df.reindex(columns=sorted(ts_df.columns))
+    coords_df = pd.concat(
+        [
+            _get_coords_df(ts_gdf),
+            _get_coords_df(
+                other_ts_gdf.loc[other_ts_gdf.index.difference(ts_gdf.index)]
+            ),
+        ]
+    ).reindex(station_ids)
+    return gpd.GeoDataFrame(
+        ts_df,
+        geometry=gpd.points_from_xy(coords_df["x"], coords_df["y"]),
+        crs=NETATMO_CRS,
+    )
+
+
+def _get_cached_ts_gdf(snapshot_filepaths, cache_filepath):
+    # snapshot files are named after their timestamp (see `dump_snapshot_gdf`), i.e.,
+    # the columns of the cached time series, so the snapshots to join are those whose
+    # file name is not among them (regardless of when the files were modified)
+    if path.exists(cache_filepath):
+        ts_gdf = _read_snapshot_gdf(cache_filepath)
+        new_snapshot_filepaths = [
+            snapshot_filepath
+            for snapshot_filepath in snapshot_filepaths
+            if path.splitext(path.basename(snapshot_filepath))[0] not in ts_gdf.columns
+        ]
+    else:
+        ts_gdf = None
+        new_snapshot_filepaths = snapshot_filepaths
+    if not new_snapshot_filepaths:
+        return ts_gdf
+
+    utils.log(
+        f"Joining {len(new_snapshot_filepaths)} snapshots not in cache file "
+        f"'{cache_filepath}'"
     )
-    return temperature_gdf[
-        ["station_id"]
-        + sorted(temperature_gdf.columns.drop(["station_id", "geometry"]))
-        + ["geometry"]
-    ].set_index("station_id")
+    new_ts_gdf = _join_snapshot_gdfs(new_snapshot_filepaths)
+    if ts_gdf is None:
+        ts_gdf = new_ts_gdf
+    else:
+        ts_gdf = _concat_ts_gdfs(ts_gdf, new_ts_gdf)
+    _write_snapshot_gdf(ts_gdf, cache_filepath)
+    return ts_gdf
 
 
 def _get_basename(snapshot_gdf):
-    # use the snapshot time (the only geo-data frame column other than "geometry")
-    return snapshot_gdf.columns.drop("geometry")[0]
+    # use the snapshot time (the only geo-data frame column other than "geometry"),
+    # which comes first (see `_gdf_from_response_json`) - a positional lookup avoids
+    # allocating a new index
+    return snapshot_gdf.columns[0]
 
 
 def plot_snapshot(  # noqa: C901
@@ -121,6 +353,7 @@ def plot_snapshot(  # noqa: C901
     *,
     snapshot_column=None,
     ax=None,
+    cax=None,
     cmap=None,
     legend=None,
     legend_position=None,
@@ -147,6 +380,12 @@ def plot_snapshot(  # noqa: C901
         than `geometry`) is used.
     ax : `matplotlib.axes.Axes` instancd, optional
         Plot in given axis. If None creates a new figure.
+    cax : `matplotlib.axes.Axes` instance, optional
+        Axis onto which the legend is drawn. If None, a new legend axis is appended to
+        `ax` (see `legend_position`, `legend_size` and `legend_pad`). Reusing the same
+        legend axis when repeatedly plotting onto the same `ax` (e.g., to animate
+        several snapshots) avoids carving a new one at each call. Ignored if `legend`
+        is False.
     cmap : str or `matplotlib.colors.Colormap` instance, optional
         Colormap of the plot. If None, the value from `settings.PLOT_CMAP` is used.
     legend : bool, optional
@@ -171,6 +410,8 @@ def plot_snapshot(  # noqa: C901
         from `settings.PLOT_TITLE` is used.
     add_basemap : bool, optional
         Whether a basemap should be added to the plot using `contextily.add_basemap`. If
+        True, the snapshot is plotted in the Web Mercator projection (EPSG:3857), i.e.,
+        the native CRS of the basemap tiles, so that they do not need to be warped. If
         None, the value from `settings.PLOT_ADD_BASEMAP` is used.
     attribution : str or bool, optional
         Attribution text for the basemap source, added to the bottom of the plot, passed
@@ -188,9 +429,15 @@ def plot_snapshot(  # noqa: C901
     ax : `matplotlib.axes.Axes`
         Axes with the plot drawn onto it.
     """
-    # if no column is provided, we plot the "first" column other than "geometry"
-    if snapshot_column is None:
-        snapshot_column = snapshot_gdf.columns.drop("geometry")[0]
+    # the plotting libraries are imported lazily since they are costly to import and
+    # not needed when only recording snapshots
+    import matplotlib.pyplot as plt
+
+    if add_basemap is None:
+        add_basemap = settings.PLOT_ADD_BASEMAP
+    snapshot_gdf, snapshot_column = _get_plot_gdf(
+        snapshot_gdf, snapshot_column, add_basemap
+    )
 
     # subplots arguments
     if ax is None:
@@ -209,7 +456,13 @@ def plot_snapshot(  # noqa: C901
         legend = _plot_kws.pop("legend", settings.PLOT_LEGEND)
 
     # plot
-    if legend:
+    if cax is None:
+        cax = _plot_kws.pop("cax", None)
+    if legend and cax is not None:
+        _plot_kws["cax"] = cax
+    elif legend:
+        from mpl_toolkits.axes_grid1 import make_axes_locatable
+
         divider = make_axes_locatable(ax)
         if legend_position is None:
             legend_position = settings.PLOT_LEGEND_POSITION
@@ -227,20 +480,9 @@ def plot_snapshot(  # noqa: C901
     snapshot_gdf.plot(
         column=snapshot_column, cmap=cmap, ax=ax, legend=legend, **_plot_kws
     )
-    if title is None:
-        title = settings.PLOT_TITLE
-    if title:
-        if title is True:
-            title_label = snapshot_column
-        elif isinstance(title, str):
-            title_label = title
-        if set_title_kws is None:
-            set_title_kws = {}
-        ax.set_title(title_label, **set_title_kws)
+    _set_title(ax, snapshot_column, title, set_title_kws)
 
     # basemap
-    if add_basemap is None:
-        add_basemap = settings.PLOT_ADD_BASEMAP
     if add_basemap:
         # raise ImportError(
         #     "The contextily package is required for adding basemaps. "
@@ -256,6 +498,8 @@ def plot_snapshot(  # noqa: C901
         if attribution is None:
             attribution = _add_basemap_kws.pop("attribution", settings.PLOT_ATTRIBUTION)
         # add basemap
+        import contextily as cx
+
         cx.add_basemap(
             ax=ax,
             crs=snapshot_gdf.crs,
@@ -266,6 +510,91 @@ def plot_snapshot(  # noqa: C901
     return ax
 
 
+def plot_snapshot_update(
+    snapshot_gdf,
+    *,
+    ax,
+    snapshot_column=None,
+    title=None,
+    add_basemap=None,
+    set_title_kws=None,
+):
+    """
+    Update a snapshot plot in place with other station measurements.
+
+    Rather than drawing the plot again, the locations and values of the stations drawn
+    by `plot_snapshot` are replaced, which is much faster when plotting many snapshots
+    onto the same axes (e.g., to animate them). The color scale (and thus the legend)
+    of the original plot is kept.
+
+    Parameters
+    ----------
+    snapshot_gdf : geopandas.GeoDataFrame
+        Geo-data frame of CWS temperature measurements.
+    ax : `matplotlib.axes.Axes` instance
+        Axes with a snapshot plot drawn onto it by `plot_snapshot`.
+    snapshot_column : str, optional
+        Column of CWS temperature measurements to plot. If None, the first column (other
+        than `geometry`) is used.
+    title : bool or str, optional
+        Whether the title of the plot should be updated. If True, the timestamp of the
+        snapshot (geo-data frame column) is used. It is also possible to pass a string
+        so that it is used as title label (instead of the timestamp). If None, the value
+        from `settings.PLOT_TITLE` is used.
+    add_basemap : bool, optional
+        Whether the plot has been drawn with a basemap (i.e., in the Web Mercator
+        projection). If None, the value from `settings.PLOT_ADD_BASEMAP` is used.
+    set_title_kws : dict, optional
+        Keyword arguments passed to `matplotlib.axes.Axes.set_title`.
+
+    Returns
+    -------
+    ax : `matplotlib.axes.Axes`
+        Axes with the updated plot.
+    """
+    if add_basemap is None:
+        add_basemap = settings.PLOT_ADD_BASEMAP
+    snapshot_gdf, snapshot_column = _get_plot_gdf(
+        snapshot_gdf, snapshot_column, add_basemap
+    )
+    # like `geopandas.GeoDataFrame.plot`, do not draw stations with missing values
+    snapshot_gdf = snapshot_gdf[snapshot_gdf[snapshot_column].notna()]
+    # the stations are the last collection drawn, after the (image) basemap
+    station_collection = ax.collections[-1]
+    station_collection.set_offsets(
+        np.column_stack([snapshot_gdf.geometry.x, snapshot_gdf.geometry.y])
+    )
+    station_collection.set_array(snapshot_gdf[snapshot_column].to_numpy())
+    _set_title(ax, snapshot_column, title, set_title_kws)
+
+    return ax
+
+
+def _get_plot_gdf(snapshot_gdf, snapshot_column, add_basemap):
+    # if no column is provided, we plot the "first" column other than "geometry"
+    if snapshot_column is None:
+        snapshot_column = snapshot_gdf.columns.drop("geometry")[0]
+    # reproject the stations (only the plotted column) rather than the basemap tiles
+    if add_basemap and snapshot_gdf.crs is not None:
+        snapshot_gdf = snapshot_gdf[[snapshot_column, "geometry"]].to_crs(
+            WEB_MERCATOR_CRS
+        )
+    return snapshot_gdf, snapshot_column
+
+
+def _set_title(ax, snapshot_column, title, set_title_kws):
+    if title is None:
+        title = settings.PLOT_TITLE
+    if title:
+        if title is True:
+            title_label = snapshot_column
+        elif isinstance(title, str):
+            title_label = title
+        if set_title_kws is None:
+            set_title_kws = {}
+        ax.set_title(title_label, **set_title_kws)
+
+
 class CWSRecorder(object):
     """CWSRecorder."""
 
@@ -285,6 +614,7 @@ class CWSRecorder(object):
         interval=None,
         at=None,
         until=None,
+        block=True,
         datetime_format=None,
         snapshot_file_ext=None,
         save_responses=None,
@@ -333,14 +663,22 @@ class CWSRecorder(object):
             * string in one of the following formats: "%Y-%m-%d %H:%M:%S",
               "%Y-%m-%d %H:%M", "%Y-%m-%d", "%H:%M:%S", "%H:%M" as defined by
               `datetime.strptime` behaviour.
+        block : bool, default True
+            Whether the initialization blocks while running the periodic snapshots
+            until there are no scheduled jobs left. If False, the snapshot job is only
+            registered in the default `schedule` scheduler, so that it can be run
+            elsewhere, e.g., by periodically calling `schedule.run_pending`. Ignored if
+            `time_unit` is None.
         datetime_format : str, optional
             Datetime format string. Used to name the geo-data frame columns and the
             snapshot file dumps. If None, the value from `settings.DATETIME_FORMAT` is
             used.
         snapshot_file_ext : str, optional
-            File extension used when dumping recorded snapshot files, which must match
-            an OGR vector format driver (see `fiona.supported_drivers`). If None, the
-            value from `settings.SNAPSHOT_FILE_EXT` is used.
+            File extension used when dumping recorded snapshot files, which must either
+            be "parquet" (GeoParquet, which is the fastest to write and read), "fgb"
+            (FlatGeobuf) or match an OGR vector format driver (see
+            `fiona.supported_drivers`). If None, the value from
+            `settings.SNAPSHOT_FILE_EXT` is used.
         save_responses : bool, optional
             Whether the JSON responses from the Netatmo public data API calls are
             stored. If None, the value from `settings.SAVE_RESPONSES` is used.
@@ -358,10 +696,12 @@ class CWSRecorder(object):
         self.dst_dir = dst_dir
 
         # auth
-        self._client_id = client_id
-        self._client_secret = client_secret
-        self._username = username
-        self._password = password
+        self._conn = _get_netatmo_connect(
+            client_id=client_id,
+            client_secret=client_secret,
+            username=username,
+            password=password,
+        )
 
         # IO
         if datetime_format is None:
@@ -379,6 +719,8 @@ class CWSRecorder(object):
 
         # schedule
         if time_unit:
+            import schedule
+
             if interval:
                 caller = schedule.every(interval)
             else:
@@ -389,31 +731,32 @@ class CWSRecorder(object):
             if until:
                 caller = caller.until(until)
             caller.do(self.dump_snapshot_gdf)
-            while schedule.get_jobs():
+            # rather than polling every second, sleep until the next job is due
+            while block and schedule.get_jobs():
+                idle_seconds = schedule.idle_seconds()
+                if idle_seconds is None:  # pragma: no cover
+                    break
+                # jobs may already be due (negative idle time)
+                if idle_seconds > 0:
+                    time.sleep(idle_seconds)
                 schedule.run_pending()
-                time.sleep(1)
 
     def get_snapshot_gdf(self):
         """Get current CWS temperature snapshot."""
-        response_json = _get_public_data(
-            self.lon_sw,
-            self.lat_sw,
-            self.lon_ne,
-            self.lat_ne,
-            client_id=self._client_id,
-            client_secret=self._client_secret,
-            username=self._username,
-            password=self._password,
+        response_content = _get_public_data(
+            self._conn, self.lon_sw, self.lat_sw, self.lon_ne, self.lat_ne
         )
 
-        snapshot_gdf = _gdf_from_response_json(response_json, self.datetime_format)
+        snapshot_gdf = _gdf_from_response_json(
+            _json_loads(response_content), self.datetime_format
+        )
 
         if self.save_responses:
             dst_response_filepath = path.join(
                 self.save_responses_dir, f"{_get_basename(snapshot_gdf)}.json"
             )
-            with open(dst_response_filepath, "w") as dst:
-                json.dump(response_json, dst)
+            with open(dst_response_filepath, "wb") as dst:
+                dst.write(response_content)
             utils.log(f"Dumped response to file '{dst_response_filepath}'")
 
         return snapshot_gdf
@@ -424,13 +767,35 @@ class CWSRecorder(object):
         dst_filepath = path.join(
             self.dst_dir, f"{_get_basename(snapshot_gdf)}.{self.snapshot_file_ext}"
         )
-        snapshot_gdf.to_file(dst_filepath)
+        _write_snapshot_gdf(snapshot_gdf, dst_filepath)
         utils.log(f"Dumped snapshot geo-data frame to file '{dst_filepath}'")
 
+    async def aget_snapshot_gdf(self):
+        """
+        Get current CWS temperature snapshot asynchronously.
+
+        The API request and the parsing of its response are run in the default executor
+        of the event loop, so that the snapshots of several recorders can be taken
+        concurrently, e.g., using `asyncio.gather`.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.get_snapshot_gdf
+        )
+
+    async def adump_snapshot_gdf(self):
+        """Get current CWS temperature snapshot and dump it to a file asynchronously."""
+        await asyncio.get_running_loop().run_in_executor(None, self.dump_snapshot_gdf)
+
 
 class CWSDataset(object):
     """CWSDataset."""
 
+    # statistics of the QC methods that do not depend on their thresholds, computed on
+    # demand and reset whenever `ts_gdf` is set
+    _ts_arr = None
+    _outlier_z_arr = None
+    _indoor_corr_ser = None
+
     def __init__(
         self,
         *,
@@ -438,6 +803,7 @@ class CWSDataset(object):
         snapshot_filepaths=None,
         snapshot_data_dir=None,
         snapshot_file_ext=None,
+        cache=None,
     ):
         """
         Initialize a CWS dataset from recorded snapshot files.
@@ -446,10 +812,12 @@ class CWSDataset(object):
         ----------
         ts_gdf_filepath : str, path or file-like object, optional
             Path to the input time series geo-data frame file, passed to
-            `geopandas.read_file`.
+            `geopandas.read_parquet` if its extension is ".parquet" or to
+            `geopandas.read_file` otherwise.
         snapshot_filepaths : list-like of str, path or file-like objects, optional
             List of paths to the input snapshot recording files, passed to
-            `geopandas.read_file`. Ignored if `ts_gdf_filepath` is provided.
+            `geopandas.read_parquet` or `geopandas.read_file` as in `ts_gdf_filepath`.
+            Ignored if `ts_gdf_filepath` is provided.
         snapshot_data_dir : str or pathlib.Path object
             Path to the directory where the snapshot recording files are located.
             Ignored if `snapshot_filepaths` is provided.
@@ -458,6 +826,14 @@ class CWSDataset(object):
             files in `snapshot_data_dir`. If None, the value from
             `settings.SNAPSHOT_FILE_EXT` is used. Ignored if `snapshot_filepaths` is
             provided.
+        cache : bool, optional
+            Whether the time series geo-data frame should be cached into a file in
+            `snapshot_data_dir` (see `settings.DATASET_CACHE_FILENAME`), so that further
+            initializations only need to read the snapshot files that are not in the
+            cache (identified by their file names, i.e., timestamps, as named by
+            `CWSRecorder.dump_snapshot_gdf`). Assumes that cached snapshot files are not
+            removed nor modified. If None, the value from `settings.DATASET_CACHE` is
+            used. Ignored if `snapshot_filepaths` is provided.
         """
         super(CWSDataset, self).__init__()
 
@@ -465,15 +841,48 @@ class CWSDataset(object):
             if snapshot_filepaths is None:
                 if snapshot_file_ext is None:
                     snapshot_file_ext = settings.SNAPSHOT_FILE_EXT
+                # note that the (hidden) cache file is not matched by the pattern
                 snapshot_filepaths = glob.glob(
                     path.join(snapshot_data_dir, f"*.{snapshot_file_ext}")
                 )
+                if not snapshot_filepaths:
+                    raise ValueError(
+                        f'no snapshot files with extension "{snapshot_file_ext}" found '
+                        f'in "{snapshot_data_dir}" - use `snapshot_file_ext` to read '
+                        'snapshots recorded in another format (e.g., "gpkg")'
+                    )
+                if cache is None:
+                    cache = settings.DATASET_CACHE
+            else:
+                cache = False
             # self.snapshot_filepaths = snapshot_filepaths
 
-            ts_gdf = _join_snapshot_gdfs(snapshot_filepaths)
+            if cache:
+                self._get_ts_gdf = partial(
+                    _get_cached_ts_gdf,
+                    snapshot_filepaths,
+                    path.join(snapshot_data_dir, settings.DATASET_CACHE_FILENAME),
+                )
+            else:
+                self._get_ts_gdf = partial(_join_snapshot_gdfs, snapshot_filepaths)
         else:
-            ts_gdf = gpd.read_file(ts_gdf_filepath).set_index("station_id")
-        self.ts_gdf = ts_gdf
+            self._get_ts_gdf = partial(_read_snapshot_gdf, ts_gdf_filepath)
+        # the time series geo-data frame is only read (or joined) on first access
+        self._ts_gdf = None
+
+    @property
+    def ts_gdf(self):
+        """Time series geo-data frame of CWS temperature measurements."""
+        if self._ts_gdf is None:
+            self._ts_gdf = self._get_ts_gdf()
+        return self._ts_gdf
+
+    @ts_gdf.setter
+    def ts_gdf(self, ts_gdf):
+        self._ts_gdf = ts_gdf
+        self._ts_arr = None
+        self._outlier_z_arr = None
+        self._indoor_corr_ser = None
 
     def get_mislocated_stations(self):
         """
@@ -491,9 +900,9 @@ class CWSDataset(object):
         """
         # ACHTUNG: this approach to dropping geometry duplicates only works for point
         # geometries - see https://github.com/geopandas/geopandas/issues/521
-        return (
-            self.ts_gdf["geometry"].apply(lambda geom: geom.wkb).duplicated(keep=False)
-        )
+        # the coordinates are extracted in a vectorized manner (instead of serializing
+        # each geometry to WKB)
+        return _get_coords_df(self.ts_gdf).duplicated(keep=False)
 
     def get_outlier_stations(
         self, *, low_alpha=None, high_alpha=None, station_outlier_threshold=None
@@ -525,9 +934,7 @@ class CWSDataset(object):
             Boolean series indicating whether a station (index) is considered an outlier
             (indicated by a value of `True`).
         """
-
-        def z_score(x):
-            return (x - x.median()) / scale.qn_scale(x.dropna())
+        from scipy.stats import norm
 
         if low_alpha is None:
             low_alpha = settings.OUTLIER_LOW_ALPHA
@@ -535,17 +942,13 @@ class CWSDataset(object):
             high_alpha = settings.OUTLIER_HIGH_ALPHA
         if station_outlier_threshold is None:
             station_outlier_threshold = settings.STATION_OUTLIER_THRESHOLD
-        ts_df = pd.DataFrame(self.ts_gdf.drop("geometry", axis=1).T)
-        nonnan_df = ~ts_df.isna()
+        z_arr, nonnan_arr = self._get_outlier_z_arr()
         low_z = norm.ppf(low_alpha)
         high_z = norm.ppf(high_alpha)
-        outlier_df = (
-            ~ts_df.apply(z_score, axis=1).apply(
-                lambda z: z.between(low_z, high_z, inclusive="neither"), axis=1
-            )
-            & nonnan_df
-        )
-        prop_outlier_ser = outlier_df.sum() / nonnan_df.sum()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            outlier_arr = ~((z_arr > low_z) & (z_arr < high_z)) & nonnan_arr
+            prop_outlier_arr = outlier_arr.sum(axis=1) / nonnan_arr.sum(axis=1)
+        prop_outlier_ser = pd.Series(prop_outlier_arr, index=self.ts_gdf.index)
 
         return prop_outlier_ser > station_outlier_threshold
 
@@ -571,11 +974,69 @@ class CWSDataset(object):
         """
         if station_indoor_corr_threshold is None:
             station_indoor_corr_threshold = settings.STATION_INDOOR_CORR_THRESHOLD
-        ts_df = self.ts_gdf.drop("geometry", axis=1)
-        median_ser = ts_df.median()
-        corr_ser = ts_df.apply(
-            lambda station_ser: station_ser.corr(median_ser),
-            axis=1,
+
+        return self._get_indoor_corr_ser() < station_indoor_corr_threshold
+
+    def _get_ts_arr(self):
+        # the QC statistics work directly on a single (station x snapshot) array, i.e.,
+        # without transposing, which is extracted once and shared among them. Even
+        # though the measurements are stored as single precision, the statistics are
+        # computed in double precision (as in pandas and statsmodels)
+        if self._ts_arr is None:
+            self._ts_arr = self.ts_gdf.drop("geometry", axis=1).to_numpy(
+                dtype=np.float64
+            )
+        return self._ts_arr
+
+    def _get_outlier_z_arr(self):
+        from statsmodels.robust import scale
+
+        if self._outlier_z_arr is not None:
+            return self._outlier_z_arr
+
+        ts_arr = self._get_ts_arr()
+        nonnan_arr = ~np.isnan(ts_arr)
+        # modified z-score of each measurement with respect to the median and Qn scale
+        # of the respective snapshot (column)
+        median_arr = np.nanmedian(ts_arr, axis=0)
+        qn_arr = np.array(
+            [
+                scale.qn_scale(snapshot_arr[nonnan_snapshot_arr])
+                for snapshot_arr, nonnan_snapshot_arr in zip(ts_arr.T, nonnan_arr.T)
+            ]
         )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_arr = (ts_arr - median_arr) / qn_arr
+        self._outlier_z_arr = z_arr, nonnan_arr
+        return self._outlier_z_arr
 
-        return corr_ser < station_indoor_corr_threshold
+    def _get_indoor_corr_ser(self):
+        if self._indoor_corr_ser is not None:
+            return self._indoor_corr_ser
+
+        ts_arr = self._get_ts_arr()
+        median_arr = np.nanmedian(ts_arr, axis=0)
+        # Pearson correlation of each station (row) with the median time series, using
+        # only the pairwise-complete observations as in `pandas.Series.corr`
+        nonnan_arr = ~np.isnan(ts_arr) & ~np.isnan(median_arr)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            num_obs_arr = nonnan_arr.sum(axis=1, keepdims=True)
+            station_arr = np.where(nonnan_arr, ts_arr, 0)
+            station_arr = np.where(
+                nonnan_arr,
+                station_arr - station_arr.sum(axis=1, keepdims=True) / num_obs_arr,
+                0,
+            )
+            median_arr = np.where(nonnan_arr, median_arr, 0)
+            median_arr = np.where(
+                nonnan_arr,
+                median_arr - median_arr.sum(axis=1, keepdims=True) / num_obs_arr,
+                0,
+            )
+            corr_arr = np.einsum("ij,ij->i", station_arr, median_arr) / (
+                np.linalg.norm(station_arr, axis=1) * np.linalg.norm(median_arr, axis=1)
+            )
+        # stations with no (or a single) complete observation get a NaN correlation and
+        # are thus not considered indoor
+        self._indoor_corr_ser = pd.Series(corr_arr, index=self.ts_gdf.index)
+        return self._indoor_corr_ser
@@ -5,13 +5,23 @@ import logging as lg
 BASE_URL = "https://api.netatmo.com"
 OAUTH2_TOKEN_URL = f"{BASE_URL}/oauth2/token"
 PUBLIC_DATA_URL = f"{BASE_URL}/api/getpublicdata"
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 10
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+# path to a JSON file where the OAuth2 token is persisted so that it can be reused
+# across runs. If None, the token is not persisted
+TOKEN_CACHE_FILEPATH = None
 
 # recording/IO
 RECORDER_DST_DIR = "./snapshot-data"
 DATETIME_FORMAT = "%Y-%m-%dT%H:%M"
 SAVE_RESPONSES = False
 SAVE_RESPONSES_DIR = "./responses"
-SNAPSHOT_FILE_EXT = "gpkg"
+SNAPSHOT_FILE_EXT = "parquet"
+READ_MAX_WORKERS = 16
+DATASET_CACHE = False
+DATASET_CACHE_FILENAME = ".ts-gdf.parquet"
 
 # plotting
 PLOT_CMAP = "coolwarm"
@@ -41,6 +41,19 @@ def ts(style="datetime", template=None):
     return ts
 
 
+def log_enabled():
+    """
+    Check whether logging is enabled.
+
+    Returns
+    -------
+    log_enabled : bool
+        Whether logging to file and/or console is turned on, i.e., whether the value of
+        either `settings.LOG_FILE` or `settings.LOG_CONSOLE` is True.
+    """
+    return bool(settings.LOG_FILE or settings.LOG_CONSOLE)
+
+
 def log(message, level=None, name=None, filename=None):
     """
     Write a message to the logger.
@@ -1,11 +1,15 @@
 #!/usr/bin/env python
 """Tests for `netatmo_geopy` package."""
 # pylint: disable=redefined-outer-name
+import asyncio
 import glob
 import json
 import logging as lg
-import threading
+import os
+import shutil
+import stat
 import time
+from concurrent import futures
 from datetime import datetime, timedelta
 from os import path
 
@@ -15,7 +19,7 @@ import pytest
 import schedule
 
 import netatmo_geopy as nat
-from netatmo_geopy import settings, utils
+from netatmo_geopy import auth, settings, utils
 
 
 @pytest.fixture
@@ -31,11 +35,16 @@ def mock_get_public_data(requests_mock):
 
 
 def test_core(requests_mock, datadir, shared_datadir, mock_auth):
+    # test that the submodules are accessible as package attributes
+    assert nat.settings is settings
+    assert nat.auth is auth
+    assert nat.core.CWSDataset is nat.CWSDataset
+
     response_ids = ["00", "01"]
 
     # test `CWSRecorder`
     # `datetime_format` is provided to ensure different file names when dumping the
-    # snapshots
+    # snapshots (whose server times in the test responses are one second apart)
     cws_recorder_args = [
         1,
         2,
@@ -55,8 +64,26 @@ def test_core(requests_mock, datadir, shared_datadir, mock_auth):
         with open(shared_datadir / f"response-{response_id}.json") as src:
             requests_mock.get(settings.PUBLIC_DATA_URL, json=json.load(src))
         cws_recorder.dump_snapshot_gdf()
-        # to ensure different file names when dumping the snapshots
-        time.sleep(2)
+    # test dumping the snapshots as OGR vector (GeoPackage) files
+    gpkg_dir = datadir / "gpkg"
+    gpkg_dir.mkdir()
+    cws_recorder = nat.CWSRecorder(
+        *cws_recorder_args,
+        **dict(cws_recorder_kws, dst_dir=gpkg_dir, snapshot_file_ext="gpkg"),
+    )
+    for response_id in response_ids:
+        with open(shared_datadir / f"response-{response_id}.json") as src:
+            requests_mock.get(settings.PUBLIC_DATA_URL, json=json.load(src))
+        cws_recorder.dump_snapshot_gdf()
+
+    # test getting snapshots asynchronously
+    async def _aget_snapshot_gdfs():
+        return await asyncio.gather(
+            cws_recorder.aget_snapshot_gdf(), cws_recorder.aget_snapshot_gdf()
+        )
+
+    for snapshot_gdf in asyncio.run(_aget_snapshot_gdfs()):
+        assert len(snapshot_gdf) == 2
 
     # test saving raw responses
     cws_recorder_kws["save_responses"] = True
@@ -71,42 +98,46 @@ def test_core(requests_mock, datadir, shared_datadir, mock_auth):
     assert len(glob.glob(response_filepattern)) == num_datadir_files + len(response_ids)
 
     # test schedule
-    # this is quite a hacky test, since `schedule` does not run in the background and we
-    # want to avoid tests that take too long to execute (especially with long idle
-    # periods).
-    # Hence, we will use a thread to start the recorder, and another to first verify
-    # that the recorder has scheduled jobs, and then cancel them so that we do not have
-    # to wait for the recorder to finish.
+    # since the recorder would otherwise block until its jobs are done (with long idle
+    # periods), use `block=False` so that we can verify that the recorder has scheduled
+    # jobs, and then cancel them
     _ = cws_recorder_kws.pop("save_responses")
     cws_recorder_kws.update(
         time_unit="minutes",
         interval=3,
         at=":30",
         until=datetime.now() + timedelta(minutes=10),
+        block=False,
     )
-
-    # we need to use a "global" variable because we cannot get function return values
-    # when using threads
-    num_jobs_dict = {}
-
-    def _get_and_cancel_jobs(num_jobs_dict):
-        num_jobs_dict["num_jobs"] = len(schedule.get_jobs())
-        schedule.clear()
-
-    t1 = threading.Thread(
-        target=nat.CWSRecorder,
-        args=cws_recorder_args,
-        kwargs=cws_recorder_kws,
-    )
-    t1.start()
-    t2 = threading.Thread(target=_get_and_cancel_jobs, args=(num_jobs_dict,))
-    t2.start()
-    assert num_jobs_dict["num_jobs"] > 0
+    nat.CWSRecorder(*cws_recorder_args, **cws_recorder_kws)
+    assert len(schedule.get_jobs()) > 0
+    schedule.clear()
 
     # test `CWSDataset`
     # test that the time series geo-data frame has the right shape
     cws_dataset = nat.CWSDataset(snapshot_data_dir=datadir)
     assert cws_dataset.ts_gdf.shape == (2, 3)
+    # test that a directory without snapshots of the given format raises a clear error
+    with pytest.raises(ValueError, match="snapshot_file_ext"):
+        nat.CWSDataset(snapshot_data_dir=gpkg_dir)
+    # test that the same time series geo-data frame is obtained from GeoPackage files
+    assert nat.CWSDataset(
+        snapshot_data_dir=gpkg_dir, snapshot_file_ext="gpkg"
+    ).ts_gdf.equals(cws_dataset.ts_gdf)
+    # test caching the time series geo-data frame, including the incremental join of
+    # the snapshots added after the cache file was written - even if they are older
+    # (e.g., synced with their modification times preserved)
+    cache_dir = datadir / "cache"
+    cache_dir.mkdir()
+    snapshot_filepaths = sorted(glob.glob(path.join(datadir, "*.parquet")))
+    shutil.copy(snapshot_filepaths[1], cache_dir)
+    cached_dataset = nat.CWSDataset(snapshot_data_dir=cache_dir, cache=True)
+    assert cached_dataset.ts_gdf.shape == (2, 2)
+    assert path.exists(cache_dir / settings.DATASET_CACHE_FILENAME)
+    shutil.copy2(snapshot_filepaths[0], cache_dir)
+    for _ in range(2):
+        cached_dataset = nat.CWSDataset(snapshot_data_dir=cache_dir, cache=True)
+        assert cached_dataset.ts_gdf.equals(cws_dataset.ts_gdf)
     # test that we can also instantiate the dataset from the time series geo-dataframe
     ts_gdf_filepath = datadir / "ts-gdf.gpkg"
     cws_dataset.ts_gdf.to_file(ts_gdf_filepath)
@@ -120,6 +151,11 @@ def test_core(requests_mock, datadir, shared_datadir, mock_auth):
     assert len(ax.get_title()) > 0
     ax = nat.plot_snapshot(cws_dataset.ts_gdf, title=False, add_basemap=False)
     assert len(ax.get_title()) == 0
+    # test reusing the legend axis
+    cax = ax.figure.axes[-1]
+    num_axes = len(ax.figure.axes)
+    ax = nat.plot_snapshot(cws_dataset.ts_gdf, ax=ax, cax=cax, add_basemap=False)
+    assert len(ax.figure.axes) == num_axes
     axes = [
         nat.plot_snapshot(
             cws_dataset.ts_gdf,
@@ -131,6 +167,17 @@ def test_core(requests_mock, datadir, shared_datadir, mock_auth):
     assert not np.array_equal(
         axes[0].collections[0].get_array(), axes[1].collections[0].get_array()
     )
+    # test updating a plot in place
+    ax = nat.plot_snapshot_update(
+        cws_dataset.ts_gdf,
+        ax=axes[0],
+        snapshot_column=cws_dataset.ts_gdf.columns[1],
+        add_basemap=False,
+    )
+    assert np.array_equal(
+        ax.collections[0].get_array(), axes[1].collections[0].get_array()
+    )
+    assert ax.get_title() == cws_dataset.ts_gdf.columns[1]
 
     # test quality controls
     # to that end, we first need a bigger time series geo-data frame, so we will create
@@ -175,6 +222,49 @@ def test_core(requests_mock, datadir, shared_datadir, mock_auth):
             station_indoor_corr_threshold=settings.STATION_INDOOR_CORR_THRESHOLD / 2
         ).sum()
     )
+    # test that the (cached) QC statistics are reset when setting another time series
+    cws_dataset.ts_gdf = cws_dataset.ts_gdf.iloc[: num_stations // 2]
+    assert len(cws_dataset.get_outlier_stations()) == num_stations // 2
+    assert len(cws_dataset.get_indoor_stations()) == num_stations // 2
+
+
+def test_token_cache(requests_mock, tmp_path, mock_auth):
+    token_cache_filepath = tmp_path / "token.json"
+    # an existing cache file with wider permissions
+    token_cache_filepath.touch(mode=0o644)
+    conn_args = ["abcd", "abcd", "john", "doe"]
+    # the first connection fetches the token and persists it (only readable/writable by
+    # its owner)
+    conn = auth.NetatmoConnect(*conn_args, token_cache_filepath=token_cache_filepath)
+    assert conn.token["access_token"] == "abcd"
+    if os.name == "posix":
+        assert stat.S_IMODE(token_cache_filepath.stat().st_mode) == 0o600
+    num_requests = requests_mock.call_count
+    # a new connection reuses the persisted token without requesting a new one
+    conn = auth.NetatmoConnect(*conn_args, token_cache_filepath=token_cache_filepath)
+    assert conn.token["access_token"] == "abcd"
+    assert requests_mock.call_count == num_requests
+    # but not for another user
+    conn = auth.NetatmoConnect(
+        *conn_args[:2], "jane", "doe", token_cache_filepath=token_cache_filepath
+    )
+    _ = conn.token
+    assert requests_mock.call_count == num_requests + 1
+
+
+def test_session_threads(requests_mock):
+    # slow down the token request so that the threads overlap while it is fetched
+    def _token_callback(request, context):
+        time.sleep(0.1)
+        return {"token_type": "bearer", "access_token": "abcd"}
+
+    requests_mock.post(settings.OAUTH2_TOKEN_URL, json=_token_callback)
+    conn = auth.NetatmoConnect("abcd", "abcd", "john", "doe")
+    # the session must only be exposed once its token has been fetched (only once)
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        tokens = list(executor.map(lambda _: conn.token, range(2)))
+    assert all(token.get("access_token") == "abcd" for token in tokens)
+    assert requests_mock.call_count == 1
 
 
 def test_logging():
@@ -184,3 +274,5 @@ def test_logging():
     utils.log("test a fake info", level=lg.INFO)
     utils.log("test a fake warning", level=lg.WARNING)
     utils.log("test a fake error", level=lg.ERROR)
+    # test the logging gate (console logging is on by default)
+    assert utils.log_enabled()